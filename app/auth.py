@@ -1,16 +1,31 @@
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
+import hashlib
+from uuid import UUID
+
+from fastapi import HTTPException, Request, status
+import jwt
+from jwt import InvalidTokenError
 from app.config import settings
-security = HTTPBearer()
+from app.utils.jwt_cache import SieveCache
+
+# Built once so option merging isn't repeated per decode. No audience is
+# configured, so tokens minted for another audience (any aud claim) are rejected
+_jwt = jwt.PyJWT()
+_algorithms = [settings.JWT_ALGORITHM]
+
+# Decoded tokens, keyed by a hash of the raw token (raw tokens are never stored)
+_token_cache = SieveCache(maxsize=50_000)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> dict:
+async def get_current_user(request: Request) -> dict:
     """
     Extract and validate JWT token.
 
+    The Authorization header is parsed directly instead of through HTTPBearer;
+    the BearerAuth scheme is declared for OpenAPI in app.main.custom_openapi.
+
+    Decoded claims are cached until the token expires, so repeated requests
+    with the same token skip signature verification and claim parsing.
+
     Returns dict with:
     - user_id: UUID
     - email: str
@@ -18,23 +33,45 @@ async def get_current_user(
     - ghost_mode: bool
     - org_id: Optional[UUID]
     """
+    authorization = request.headers.get("authorization")
+    if not authorization or authorization[:7].lower() != "bearer ":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+    token = authorization[7:]
+    token_hash = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    user = _token_cache.get(token_hash)
+    if user is not None:
+        request.state.user = user
+        return user
+
     try:
-        token = credentials.credentials
-        payload = jwt.decode(
+        payload = _jwt.decode(
             token,
             settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
+            algorithms=_algorithms
         )
 
-        return {
-            "user_id": payload["sub"],
+        user = {
+            "user_id": UUID(payload["sub"]),
             "email": payload["email"],
             "subscription_level": payload.get("subscription_level", "free"),
             "ghost_mode": payload.get("ghost_mode", False),
-            "org_id": payload.get("org_id")
+            "org_id": UUID(payload["org_id"]) if payload.get("org_id") else None
         }
-    except JWTError as e:
+    except (InvalidTokenError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+
+    # Tokens without an expiry are not cached; the cache drops entries once exp passes
+    exp = payload.get("exp")
+    if exp is not None:
+        _token_cache.insert(token_hash, user, exp)
+
+    # Exposed for per-user rate limit keys (see app.utils.rate_limit.get_user_key)
+    request.state.user = user
+    return user
@@ -1,4 +1,7 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -11,6 +14,13 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: str
+    # Pool sizes are per worker process: total connections = WORKERS x size
+    DB_POOL_MIN_SIZE: int = 20
+    DB_POOL_MAX_SIZE: int = 100
+    DB_POOL_MAX_QUERIES: int = 50_000
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_COMMAND_TIMEOUT: float = 60
+    DB_STATEMENT_CACHE_SIZE: int = 100
 
     # JWT
     JWT_SECRET_KEY: str
@@ -20,18 +30,27 @@ class Settings(BaseSettings):
     REDIS_HOST: str
     REDIS_PORT: int
 
+    # Rate limiting (storage defaults to the Redis above; memory:// for tests)
+    RATE_LIMIT_STORAGE_URI: Optional[str] = None
+    RATE_LIMIT_REDIS_TIMEOUT: float = 0.25
+
     # API
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8001
+    WORKERS: int = 1
 
     # API Documentation (Swagger UI / OpenAPI)
     ENABLE_DOCS: bool = True
     API_VERSION: str = "1.0.0"
     PROJECT_NAME: str = "Activity Platform - Participation API"
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
+
+
+@lru_cache()
+def get_settings() -> Settings:
+    """Load settings once; every caller shares the same validated instance"""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,5 +1,6 @@
 import asyncpg
 import logging
+import orjson
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -8,6 +9,19 @@ logger = logging.getLogger(__name__)
 db_pool = None
 
 
+async def _init_connection(conn):
+    """Register codecs once per new connection"""
+    # JSONB in binary format (version byte + JSON text), encoded/decoded by orjson.
+    # Routes pass and receive plain lists/dicts instead of JSON strings.
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: b"\x01" + orjson.dumps(value),
+        decoder=lambda data: orjson.loads(data[1:]),
+        schema="pg_catalog",
+        format="binary"
+    )
+
+
 async def get_db_pool():
     """Create asyncpg connection pool"""
     return await asyncpg.create_pool(
@@ -16,9 +30,20 @@ async def get_db_pool():
         database=settings.DB_NAME,
         user=settings.DB_USER,
         password=settings.DB_PASSWORD,
-        min_size=10,
-        max_size=50,
-        command_timeout=60
+        min_size=settings.DB_POOL_MIN_SIZE,
+        max_size=settings.DB_POOL_MAX_SIZE,
+        # Recycle connections so server-side caches don't grow without bound
+        max_queries=settings.DB_POOL_MAX_QUERIES,
+        max_inactive_connection_lifetime=settings.DB_POOL_MAX_INACTIVE_LIFETIME,
+        command_timeout=settings.DB_COMMAND_TIMEOUT,
+        # asyncpg prepares each distinct query text once per connection and reuses the
+        # server-side statement on later calls (it survives pool release); the LRU
+        # must hold every SP query the routes issue (17 today)
+        statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+        # Sent at connection startup, so it survives the RESET ALL on pool release.
+        # The SP calls are short OLTP queries where JIT compilation only adds latency.
+        server_settings={"jit": "off"},
+        init=_init_connection
     )
 
 
@@ -27,8 +52,13 @@ async def init_db():
     global db_pool
     logger.info("=== INITIALIZING DATABASE POOL ===")
     try:
+        # create_pool() returns only after min_size connections are established
+        # (and passed through init), so the pool is warm before traffic arrives
         db_pool = await get_db_pool()
-        logger.info(f"=== DATABASE POOL INITIALIZED: {db_pool} ===")
+        logger.info(
+            f"=== DATABASE POOL INITIALIZED: {db_pool.get_size()} connections open "
+            f"(min={db_pool.get_min_size()}, max={db_pool.get_max_size()}) ==="
+        )
     except Exception as e:
         logger.error(f"=== DATABASE POOL INITIALIZATION FAILED: {e} ===")
         raise
@@ -36,14 +66,16 @@ async def init_db():
 
 async def close_db():
     """Close database pool on shutdown"""
-    global db_pool
     if db_pool:
         await db_pool.close()
 
 
-def get_pool():
-    """Get database pool for dependency injection"""
-    global db_pool
+async def get_pool() -> asyncpg.Pool:
+    """
+    Get database pool for dependency injection.
+
+    Async so FastAPI calls it inline instead of dispatching it to the threadpool.
+    """
     if db_pool is None:
         raise RuntimeError("Database pool not initialized")
     return db_pool
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
 from contextlib import asynccontextmanager
 import logging
@@ -26,6 +27,9 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("=== LIFESPAN STARTUP BEGIN ===")
     await init_db()
+    if settings.ENABLE_DOCS:
+        # Build the OpenAPI schema now instead of on the first /openapi.json or /docs hit
+        app.openapi()
     logger.info("=== LIFESPAN STARTUP COMPLETE ===")
     yield
     # Shutdown
@@ -57,6 +61,7 @@ Features PostgreSQL stored procedures, JWT authentication, and comprehensive act
     openapi_url="/openapi.json" if settings.ENABLE_DOCS else None,
     contact={"name": "Activity Platform Team", "email": "dev@activityapp.com"},
     license_info={"name": "Proprietary"},
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -83,7 +88,8 @@ def custom_openapi():
     return app.openapi_schema
 
 
-app.openapi = custom_openapi
+if settings.ENABLE_DOCS:
+    app.openapi = custom_openapi
 
 # CORS
 app.add_middleware(
@@ -109,12 +115,17 @@ app.include_router(waitlist.router)
 
 if __name__ == "__main__":
     import uvicorn
-    from app.config import get_settings
 
-    settings = get_settings()
+    development = settings.ENVIRONMENT == "development"
     uvicorn.run(
         "app.main:app",
         host=settings.API_HOST,
         port=settings.API_PORT,
-        reload=settings.ENVIRONMENT == "development"
+        # C-accelerated event loop and HTTP parser (both ship with uvicorn[standard])
+        loop="uvloop",
+        http="httptools",
+        # --reload cannot be combined with multiple workers; each worker opens
+        # its own DB pool, so size WORKERS together with DB_POOL_MAX_SIZE
+        workers=None if development else settings.WORKERS,
+        reload=development
     )
@@ -39,9 +39,9 @@ class CancelParticipationResponse(BaseModel):
 class ParticipantInfo(BaseModel):
     user_id: UUID
     username: str
-    first_name: Optional[str]
-    last_name: Optional[str]
-    profile_photo_url: Optional[str]
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    profile_photo_url: Optional[str] = None
     role: str
     participation_status: str
     attendance_status: str
@@ -60,14 +60,14 @@ class ActivityInfo(BaseModel):
     activity_id: UUID
     title: str
     scheduled_at: datetime
-    location_name: Optional[str]
-    city: Optional[str]
+    location_name: Optional[str] = None
+    city: Optional[str] = None
     organizer_user_id: UUID
     organizer_username: str
     current_participants_count: int
-    max_participants: Optional[int]
+    max_participants: Optional[int] = None
     activity_type: str
-    role: Optional[str]
+    role: Optional[str] = None
     participation_status: str
     attendance_status: str
     joined_at: datetime
@@ -121,8 +121,8 @@ class ConfirmAttendanceResponse(BaseModel):
 class PendingVerificationParticipant(BaseModel):
     user_id: UUID
     username: str
-    first_name: Optional[str]
-    profile_photo_url: Optional[str]
+    first_name: Optional[str] = None
+    profile_photo_url: Optional[str] = None
 
 
 class PendingVerificationActivity(BaseModel):
@@ -192,10 +192,10 @@ class InvitationInfo(BaseModel):
     invited_by_user_id: UUID
     invited_by_username: str
     status: str
-    message: Optional[str]
+    message: Optional[str] = None
     invited_at: datetime
     expires_at: datetime
-    responded_at: Optional[datetime]
+    responded_at: Optional[datetime] = None
 
 
 class ReceivedInvitationsResponse(BaseModel):
@@ -210,10 +210,10 @@ class SentInvitationInfo(BaseModel):
     user_id: UUID
     username: str
     status: str
-    message: Optional[str]
+    message: Optional[str] = None
     invited_at: datetime
     expires_at: datetime
-    responded_at: Optional[datetime]
+    responded_at: Optional[datetime] = None
 
 
 class SentInvitationsResponse(BaseModel):
@@ -225,11 +225,11 @@ class WaitlistEntry(BaseModel):
     waitlist_id: UUID
     user_id: UUID
     username: str
-    first_name: Optional[str]
-    profile_photo_url: Optional[str]
+    first_name: Optional[str] = None
+    profile_photo_url: Optional[str] = None
     position: int
     created_at: datetime
-    notified_at: Optional[datetime]
+    notified_at: Optional[datetime] = None
 
 
 class WaitlistResponse(BaseModel):
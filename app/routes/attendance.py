@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, Request
 from uuid import UUID
-from datetime import datetime
-import json
+import asyncpg
 
 from app.auth import get_current_user
 from app.database import get_pool
@@ -16,9 +15,14 @@ from app.models.responses import (
 )
 from app.utils.errors import map_sp_error
 from app.utils.rate_limit import limiter
+from app.utils.responses import trusted_response
 
 router = APIRouter(prefix="/api/v1/participation", tags=["attendance"])
 
+SP_MARK_ATTENDANCE = "SELECT * FROM activity.sp_mark_attendance($1, $2, $3::jsonb)"
+SP_CONFIRM_ATTENDANCE = "SELECT * FROM activity.sp_confirm_attendance($1, $2, $3)"
+SP_GET_PENDING_VERIFICATIONS = "SELECT * FROM activity.sp_get_pending_verifications($1, $2, $3)"
+
 
 @router.post("/activities/{activity_id}/attendance", response_model=MarkAttendanceResponse)
 @limiter.limit("5/minute")
@@ -27,7 +31,7 @@ async def mark_attendance(
     activity_id: UUID,
     body: MarkAttendanceRequest,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Mark attendance for participants (organizer/co-organizer only).
@@ -35,35 +39,35 @@ async def mark_attendance(
     Supports bulk updates (max 100).
     No-shows increment user's no_show_count.
     """
-    # Convert attendances to JSONB format for SP
-    attendances_json = json.dumps([
-        {"user_id": str(att.user_id), "status": att.status}
+    # JSONB parameter, encoded by the connection's jsonb codec (orjson writes UUIDs natively)
+    attendances = [
+        {"user_id": att.user_id, "status": att.status}
         for att in body.attendances
-    ])
+    ]
 
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_mark_attendance($1, $2, $3::jsonb)
-            """,
+            SP_MARK_ATTENDANCE,
             activity_id,
-            UUID(current_user["user_id"]),
-            attendances_json
+            current_user["user_id"],
+            attendances
         )
 
         if not result["success"]:
             raise map_sp_error(result["error_code"], result["error_message"])
 
-        # Parse failed_updates JSONB
-        failed_updates = json.loads(result["failed_updates"]) if result["failed_updates"] else []
+        # failed_updates JSONB arrives already decoded
+        failed_updates = result["failed_updates"] or []
         failed_user_ids = {UUID(f["user_id"]) for f in failed_updates}
 
-        # Build successful attendances list (exclude failed)
+        # Build successful attendances list (exclude failed).
+        # Entries were validated on the way in, so construct without re-validating.
+        updated_at = result["updated_at"]
         successful_attendances = [
-            AttendanceUpdate(
+            AttendanceUpdate.model_construct(
                 user_id=att.user_id,
                 attendance_status=att.status,
-                updated_at=datetime.now()
+                updated_at=updated_at
             )
             for att in body.attendances
             if att.user_id not in failed_user_ids
@@ -83,7 +87,7 @@ async def confirm_attendance(
     request: Request,
     body: ConfirmAttendanceRequest,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Confirm other participant's attendance (peer verification).
@@ -91,25 +95,25 @@ async def confirm_attendance(
     Both users must have attendance_status='attended'.
     Increments verified user's verification_count.
     """
+    confirmer_user_id = current_user["user_id"]
+
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_confirm_attendance($1, $2, $3)
-            """,
+            SP_CONFIRM_ATTENDANCE,
             body.activity_id,
             body.confirmed_user_id,
-            UUID(current_user["user_id"])
+            confirmer_user_id
         )
 
         if not result["success"]:
             raise map_sp_error(result["error_code"], result["error_message"])
 
-        return ConfirmAttendanceResponse(
+        return ConfirmAttendanceResponse.model_construct(
             confirmation_id=result["confirmation_id"],
             activity_id=body.activity_id,
             confirmed_user_id=body.confirmed_user_id,
-            confirmer_user_id=UUID(current_user["user_id"]),
-            created_at=datetime.now(),
+            confirmer_user_id=confirmer_user_id,
+            created_at=result["created_at"],
             verification_count_updated=result["new_verification_count"],
             message="Attendance confirmed successfully"
         )
@@ -122,7 +126,7 @@ async def get_pending_verifications(
     limit: int = 20,
     offset: int = 0,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     List activities where user attended but hasn't confirmed all participants.
@@ -131,22 +135,20 @@ async def get_pending_verifications(
     """
     async with pool.acquire() as conn:
         rows = await conn.fetch(
-            """
-            SELECT * FROM activity.sp_get_pending_verifications($1, $2, $3)
-            """,
-            UUID(current_user["user_id"]),
+            SP_GET_PENDING_VERIFICATIONS,
+            current_user["user_id"],
             limit,
             offset
         )
 
         total_count = rows[0]["total_count"] if rows else 0
 
-        # Parse participants_to_confirm JSONB for each row
+        # participants_to_confirm JSONB arrives already decoded
         pending_verifications = []
         for row in rows:
-            participants_data = json.loads(row["participants_to_confirm"]) if row["participants_to_confirm"] else []
+            participants_data = row["participants_to_confirm"] or []
             participants = [
-                PendingVerificationParticipant(
+                PendingVerificationParticipant.model_construct(
                     user_id=UUID(p["user_id"]),
                     username=p["username"],
                     first_name=p.get("first_name"),
@@ -156,7 +158,7 @@ async def get_pending_verifications(
             ]
 
             pending_verifications.append(
-                PendingVerificationActivity(
+                PendingVerificationActivity.model_construct(
                     activity_id=row["activity_id"],
                     title=row["title"],
                     scheduled_at=row["scheduled_at"],
@@ -164,7 +166,7 @@ async def get_pending_verifications(
                 )
             )
 
-        return PendingVerificationsResponse(
+        return trusted_response(PendingVerificationsResponse.model_construct(
             total_count=total_count,
             pending_verifications=pending_verifications
-        )
+        ), exclude_none=True)
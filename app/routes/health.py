@@ -1,8 +1,20 @@
 from fastapi import APIRouter
-from datetime import datetime
+from datetime import datetime, timezone
+import time
 
 router = APIRouter(prefix="/api/v1/participation", tags=["health"])
 
+# (unix second, ISO timestamp) of the last health response
+_last_timestamp = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO string, rebuilt at most once per second"""
+    now = int(time.time())
+    if now != _last_timestamp[0]:
+        _last_timestamp[:] = [now, datetime.fromtimestamp(now, timezone.utc).isoformat()]
+    return _last_timestamp[1]
+
 
 @router.get("/health")
 async def health_check():
@@ -11,5 +23,5 @@ async def health_check():
         "status": "healthy",
         "service": "participation-api",
         "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
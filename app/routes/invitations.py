@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, Request
 from uuid import UUID
-from datetime import datetime
 from typing import Optional
-import json
+import asyncpg
 
 from app.auth import get_current_user
 from app.database import get_pool
@@ -20,19 +19,28 @@ from app.models.responses import (
     SentInvitationInfo
 )
 from app.utils.errors import map_sp_error
-from app.utils.rate_limit import limiter
+from app.utils.rate_limit import limiter, get_user_key, get_user_activity_key
+from app.utils.responses import trusted_response
 
 router = APIRouter(prefix="/api/v1/participation", tags=["invitations"])
 
+SP_SEND_INVITATIONS = "SELECT * FROM activity.sp_send_invitations($1, $2, $3::uuid[], $4, $5)"
+SP_ACCEPT_INVITATION = "SELECT * FROM activity.sp_accept_invitation($1, $2)"
+SP_DECLINE_INVITATION = "SELECT * FROM activity.sp_decline_invitation($1, $2)"
+SP_CANCEL_INVITATION = "SELECT * FROM activity.sp_cancel_invitation($1, $2)"
+SP_GET_RECEIVED_INVITATIONS = "SELECT * FROM activity.sp_get_received_invitations($1, $2, $3, $4)"
+SP_GET_SENT_INVITATIONS = "SELECT * FROM activity.sp_get_sent_invitations($1, $2, $3, $4, $5)"
 
+
+# Bucket-like budget per organizer per activity: bursts of 10, about 5/minute sustained
 @router.post("/activities/{activity_id}/invitations", response_model=SendInvitationsResponse)
-@limiter.limit("5/minute")
+@limiter.shared_limit("10/minute;50/10 minutes", scope="send_invitations", key_func=get_user_activity_key)
 async def send_invitations(
     request: Request,
     activity_id: UUID,
     body: SendInvitationsRequest,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Send invitations to users (organizer/co-organizer only).
@@ -40,17 +48,12 @@ async def send_invitations(
     Supports bulk (max 50).
     Only for invite-only activities.
     """
-    # Convert user_ids to PostgreSQL UUID array
-    user_ids_array = [str(uid) for uid in body.user_ids]
-
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_send_invitations($1, $2, $3::uuid[], $4, $5)
-            """,
+            SP_SEND_INVITATIONS,
             activity_id,
-            UUID(current_user["user_id"]),
-            user_ids_array,
+            current_user["user_id"],
+            body.user_ids,  # asyncpg encodes List[UUID] as uuid[] in binary
             body.message,
             body.expires_in_hours
         )
@@ -58,27 +61,16 @@ async def send_invitations(
         if not result["success"]:
             raise map_sp_error(result["error_code"], result["error_message"])
 
-        # Parse invitations and failed_invitations JSONB
-        invitations_data = json.loads(result["invitations"]) if result["invitations"] else []
-        failed_invitations_data = json.loads(result["failed_invitations"]) if result["failed_invitations"] else []
-
+        # invitations and failed_invitations are arrays of composite rows; asyncpg
+        # decodes them into Records with UUID/datetime values already in place
         invitations = [
-            InvitationCreated(
-                invitation_id=UUID(inv["invitation_id"]),
-                user_id=UUID(inv["user_id"]),
-                status=inv["status"],
-                invited_at=datetime.fromisoformat(inv["invited_at"]),
-                expires_at=datetime.fromisoformat(inv["expires_at"])
-            )
-            for inv in invitations_data
+            InvitationCreated.model_construct(**inv)
+            for inv in result["invitations"] or []
         ]
 
         failed_invitations = [
-            FailedInvitation(
-                user_id=UUID(f["user_id"]),
-                reason=f["reason"]
-            )
-            for f in failed_invitations_data
+            FailedInvitation.model_construct(**f)
+            for f in result["failed_invitations"] or []
         ]
 
         return SendInvitationsResponse(
@@ -92,12 +84,12 @@ async def send_invitations(
 
 
 @router.post("/invitations/{invitation_id}/accept", response_model=AcceptInvitationResponse)
-@limiter.limit("10/minute")
+@limiter.shared_limit("10/minute", scope="accept_invitation", key_func=get_user_key)
 async def accept_invitation(
     request: Request,
     invitation_id: UUID,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Accept invitation and join activity.
@@ -106,11 +98,9 @@ async def accept_invitation(
     """
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_accept_invitation($1, $2)
-            """,
+            SP_ACCEPT_INVITATION,
             invitation_id,
-            UUID(current_user["user_id"])
+            current_user["user_id"]
         )
 
         if not result["success"]:
@@ -122,7 +112,7 @@ async def accept_invitation(
             status="accepted",
             participation_status=result["participation_status"],
             waitlist_position=result.get("waitlist_position"),
-            responded_at=datetime.now(),
+            responded_at=result["responded_at"],
             message="Invitation accepted and joined activity successfully"
         )
 
@@ -133,16 +123,14 @@ async def decline_invitation(
     request: Request,
     invitation_id: UUID,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """Decline invitation"""
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_decline_invitation($1, $2)
-            """,
+            SP_DECLINE_INVITATION,
             invitation_id,
-            UUID(current_user["user_id"])
+            current_user["user_id"]
         )
 
         if not result["success"]:
@@ -152,7 +140,7 @@ async def decline_invitation(
             invitation_id=invitation_id,
             activity_id=result["activity_id"],
             status="declined",
-            responded_at=datetime.now(),
+            responded_at=result["responded_at"],
             message="Invitation declined"
         )
 
@@ -163,18 +151,16 @@ async def cancel_invitation(
     request: Request,
     invitation_id: UUID,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Cancel invitation (sender only).
     """
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_cancel_invitation($1, $2)
-            """,
+            SP_CANCEL_INVITATION,
             invitation_id,
-            UUID(current_user["user_id"])
+            current_user["user_id"]
         )
 
         if not result["success"]:
@@ -183,7 +169,7 @@ async def cancel_invitation(
         return CancelInvitationResponse(
             invitation_id=invitation_id,
             activity_id=result["activity_id"],
-            cancelled_at=datetime.now(),
+            cancelled_at=result["cancelled_at"],
             message="Invitation cancelled successfully"
         )
 
@@ -196,15 +182,13 @@ async def get_received_invitations(
     limit: int = 20,
     offset: int = 0,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """List invitations received by current user"""
     async with pool.acquire() as conn:
         rows = await conn.fetch(
-            """
-            SELECT * FROM activity.sp_get_received_invitations($1, $2, $3, $4)
-            """,
-            UUID(current_user["user_id"]),
+            SP_GET_RECEIVED_INVITATIONS,
+            current_user["user_id"],
             status,
             limit,
             offset
@@ -213,26 +197,14 @@ async def get_received_invitations(
         total_count = rows[0]["total_count"] if rows else 0
 
         invitations = [
-            InvitationInfo(
-                invitation_id=row["invitation_id"],
-                activity_id=row["activity_id"],
-                activity_title=row["activity_title"],
-                activity_scheduled_at=row["activity_scheduled_at"],
-                invited_by_user_id=row["invited_by_user_id"],
-                invited_by_username=row["invited_by_username"],
-                status=row["status"],
-                message=row["message"],
-                invited_at=row["invited_at"],
-                expires_at=row["expires_at"],
-                responded_at=row["responded_at"]
-            )
+            InvitationInfo.model_construct(**dict(row))
             for row in rows
         ]
 
-        return ReceivedInvitationsResponse(
+        return trusted_response(ReceivedInvitationsResponse.model_construct(
             total_count=total_count,
             invitations=invitations
-        )
+        ), exclude_none=True)
 
 
 @router.get("/invitations/sent", response_model=SentInvitationsResponse)
@@ -244,15 +216,13 @@ async def get_sent_invitations(
     limit: int = 20,
     offset: int = 0,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """List invitations sent by current user"""
     async with pool.acquire() as conn:
         rows = await conn.fetch(
-            """
-            SELECT * FROM activity.sp_get_sent_invitations($1, $2, $3, $4, $5)
-            """,
-            UUID(current_user["user_id"]),
+            SP_GET_SENT_INVITATIONS,
+            current_user["user_id"],
             activity_id,
             status,
             limit,
@@ -262,22 +232,11 @@ async def get_sent_invitations(
         total_count = rows[0]["total_count"] if rows else 0
 
         invitations = [
-            SentInvitationInfo(
-                invitation_id=row["invitation_id"],
-                activity_id=row["activity_id"],
-                activity_title=row["activity_title"],
-                user_id=row["user_id"],
-                username=row["username"],
-                status=row["status"],
-                message=row["message"],
-                invited_at=row["invited_at"],
-                expires_at=row["expires_at"],
-                responded_at=row["responded_at"]
-            )
+            SentInvitationInfo.model_construct(**dict(row))
             for row in rows
         ]
 
-        return SentInvitationsResponse(
+        return trusted_response(SentInvitationsResponse.model_construct(
             total_count=total_count,
             invitations=invitations
-        )
+        ), exclude_none=True)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from uuid import UUID
-from datetime import datetime
 from typing import Optional
+import asyncpg
 
 from app.auth import get_current_user
 from app.database import get_pool
@@ -18,9 +18,16 @@ from app.models.responses import (
 )
 from app.utils.errors import map_sp_error
 from app.utils.rate_limit import limiter
+from app.utils.responses import trusted_response
 
 router = APIRouter(prefix="/api/v1/participation", tags=["participation"])
 
+SP_JOIN_ACTIVITY = "SELECT * FROM activity.sp_join_activity($1, $2, $3)"
+SP_LEAVE_ACTIVITY = "SELECT * FROM activity.sp_leave_activity($1, $2)"
+SP_CANCEL_PARTICIPATION = "SELECT * FROM activity.sp_cancel_participation($1, $2, $3)"
+SP_LIST_PARTICIPANTS = "SELECT * FROM activity.sp_list_participants($1, $2, $3, $4, $5, $6)"
+SP_GET_USER_ACTIVITIES = "SELECT * FROM activity.sp_get_user_activities($1, $2, $3, $4, $5, $6)"
+
 
 @router.post("/activities/{activity_id}/join", response_model=JoinActivityResponse)
 @limiter.limit("10/minute")
@@ -28,7 +35,7 @@ async def join_activity(
     request: Request,
     activity_id: UUID,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Join an activity (or join waitlist if full).
@@ -38,36 +45,29 @@ async def join_activity(
     """
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_join_activity($1, $2, $3)
-            """,
+            SP_JOIN_ACTIVITY,
             activity_id,
-            UUID(current_user["user_id"]),
+            current_user["user_id"],
             current_user["subscription_level"]
         )
 
         if not result["success"]:
             raise map_sp_error(result["error_code"], result["error_message"])
 
-        # Build response based on participation_status
-        if result["participation_status"] == "waitlisted":
-            return JoinActivityResponse(
-                activity_id=activity_id,
-                user_id=UUID(current_user["user_id"]),
-                participation_status="waitlisted",
-                waitlist_position=result["waitlist_position"],
-                joined_at=datetime.now(),
-                message=f"Activity is full. You have been added to the waitlist at position {result['waitlist_position']}."
-            )
-        else:
-            return JoinActivityResponse(
-                activity_id=activity_id,
-                user_id=UUID(current_user["user_id"]),
-                role="member",
-                participation_status="registered",
-                joined_at=datetime.now(),
-                message="Successfully joined activity"
+        # Waitlisted users get no role yet; the SP returns a NULL position otherwise
+        waitlisted = result["participation_status"] == "waitlisted"
+        return JoinActivityResponse(
+            activity_id=activity_id,
+            user_id=current_user["user_id"],
+            role=None if waitlisted else "member",
+            participation_status=result["participation_status"],
+            waitlist_position=result["waitlist_position"],
+            joined_at=result["joined_at"],
+            message=(
+                f"Activity is full. You have been added to the waitlist at position {result['waitlist_position']}."
+                if waitlisted else "Successfully joined activity"
             )
+        )
 
 
 @router.delete("/activities/{activity_id}/leave", response_model=LeaveActivityResponse)
@@ -76,7 +76,7 @@ async def leave_activity(
     request: Request,
     activity_id: UUID,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Leave an activity.
@@ -85,11 +85,9 @@ async def leave_activity(
     """
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_leave_activity($1, $2)
-            """,
+            SP_LEAVE_ACTIVITY,
             activity_id,
-            UUID(current_user["user_id"])
+            current_user["user_id"]
         )
 
         if not result["success"]:
@@ -100,13 +98,13 @@ async def leave_activity(
         if result.get("promoted_user_id"):
             waitlist_promoted = WaitlistPromotedInfo(
                 user_id=result["promoted_user_id"],
-                promoted_at=datetime.now()
+                promoted_at=result["left_at"]
             )
 
         return LeaveActivityResponse(
             activity_id=activity_id,
-            user_id=UUID(current_user["user_id"]),
-            left_at=datetime.now(),
+            user_id=current_user["user_id"],
+            left_at=result["left_at"],
             waitlist_promoted=waitlist_promoted,
             message="Successfully left activity"
         )
@@ -119,7 +117,7 @@ async def cancel_participation(
     activity_id: UUID,
     body: CancelParticipationRequest,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Cancel participation (keeps record but marks as cancelled).
@@ -128,11 +126,9 @@ async def cancel_participation(
     """
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_cancel_participation($1, $2, $3)
-            """,
+            SP_CANCEL_PARTICIPATION,
             activity_id,
-            UUID(current_user["user_id"]),
+            current_user["user_id"],
             body.reason
         )
 
@@ -144,14 +140,14 @@ async def cancel_participation(
         if result.get("promoted_user_id"):
             waitlist_promoted = WaitlistPromotedInfo(
                 user_id=result["promoted_user_id"],
-                promoted_at=datetime.now()
+                promoted_at=result["left_at"]
             )
 
         return CancelParticipationResponse(
             activity_id=activity_id,
-            user_id=UUID(current_user["user_id"]),
+            user_id=current_user["user_id"],
             participation_status="cancelled",
-            left_at=datetime.now(),
+            left_at=result["left_at"],
             waitlist_promoted=waitlist_promoted,
             message="Participation cancelled successfully"
         )
@@ -167,7 +163,7 @@ async def list_participants(
     limit: int = 50,
     offset: int = 0,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     List participants of activity (respects blocking).
@@ -180,11 +176,9 @@ async def list_participants(
     """
     async with pool.acquire() as conn:
         rows = await conn.fetch(
-            """
-            SELECT * FROM activity.sp_list_participants($1, $2, $3, $4, $5, $6)
-            """,
+            SP_LIST_PARTICIPANTS,
             activity_id,
-            UUID(current_user["user_id"]),
+            current_user["user_id"],
             status,
             role,
             limit,
@@ -198,29 +192,17 @@ async def list_participants(
         # Get total count from first row
         total_count = rows[0]["total_count"] if rows else 0
 
-        # Build participant list
+        # Build participant list (rows are trusted SP output, so skip validation)
         participants = [
-            ParticipantInfo(
-                user_id=row["user_id"],
-                username=row["username"],
-                first_name=row["first_name"],
-                last_name=row["last_name"],
-                profile_photo_url=row["profile_photo_url"],
-                role=row["role"],
-                participation_status=row["participation_status"],
-                attendance_status=row["attendance_status"],
-                joined_at=row["joined_at"],
-                is_verified=row["is_verified"],
-                verification_count=row["verification_count"]
-            )
+            ParticipantInfo.model_construct(**dict(row))
             for row in rows
         ]
 
-        return ListParticipantsResponse(
+        return trusted_response(ListParticipantsResponse.model_construct(
             activity_id=activity_id,
             total_count=total_count,
             participants=participants
-        )
+        ), exclude_none=True)
 
 
 @router.get("/users/{user_id}/activities", response_model=UserActivitiesResponse)
@@ -233,7 +215,7 @@ async def get_user_activities(
     limit: int = 20,
     offset: int = 0,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     List user's activities (own or other if allowed).
@@ -242,11 +224,9 @@ async def get_user_activities(
     """
     async with pool.acquire() as conn:
         rows = await conn.fetch(
-            """
-            SELECT * FROM activity.sp_get_user_activities($1, $2, $3, $4, $5, $6)
-            """,
+            SP_GET_USER_ACTIVITIES,
             user_id,
-            UUID(current_user["user_id"]),
+            current_user["user_id"],
             type,
             status,
             limit,
@@ -257,27 +237,12 @@ async def get_user_activities(
         total_count = rows[0]["total_count"] if rows else 0
 
         activities = [
-            ActivityInfo(
-                activity_id=row["activity_id"],
-                title=row["title"],
-                scheduled_at=row["scheduled_at"],
-                location_name=row["location_name"],
-                city=row["city"],
-                organizer_user_id=row["organizer_user_id"],
-                organizer_username=row["organizer_username"],
-                current_participants_count=row["current_participants_count"],
-                max_participants=row["max_participants"],
-                activity_type=row["activity_type"],
-                role=row["role"],
-                participation_status=row["participation_status"],
-                attendance_status=row["attendance_status"],
-                joined_at=row["joined_at"]
-            )
+            ActivityInfo.model_construct(**dict(row))
             for row in rows
         ]
 
-        return UserActivitiesResponse(
+        return trusted_response(UserActivitiesResponse.model_construct(
             user_id=user_id,
             total_count=total_count,
             activities=activities
-        )
+        ), exclude_none=True)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, Request
 from uuid import UUID
-from datetime import datetime
+import asyncpg
 
 from app.auth import get_current_user
 from app.database import get_pool
@@ -11,6 +11,9 @@ from app.utils.rate_limit import limiter
 
 router = APIRouter(prefix="/api/v1/participation", tags=["role_management"])
 
+SP_PROMOTE_PARTICIPANT = "SELECT * FROM activity.sp_promote_participant($1, $2, $3)"
+SP_DEMOTE_PARTICIPANT = "SELECT * FROM activity.sp_demote_participant($1, $2, $3)"
+
 
 @router.post("/activities/{activity_id}/promote", response_model=PromoteParticipantResponse)
 @limiter.limit("10/minute")
@@ -19,18 +22,16 @@ async def promote_participant(
     activity_id: UUID,
     body: PromoteParticipantRequest,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Promote member to co-organizer (organizer only).
     """
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_promote_participant($1, $2, $3)
-            """,
+            SP_PROMOTE_PARTICIPANT,
             activity_id,
-            UUID(current_user["user_id"]),
+            current_user["user_id"],
             body.user_id
         )
 
@@ -41,7 +42,7 @@ async def promote_participant(
             activity_id=activity_id,
             user_id=body.user_id,
             role="co_organizer",
-            promoted_at=datetime.now(),
+            promoted_at=result["promoted_at"],
             message="User promoted to co-organizer successfully"
         )
 
@@ -53,18 +54,16 @@ async def demote_participant(
     activity_id: UUID,
     body: DemoteParticipantRequest,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     Demote co-organizer to member (organizer only).
     """
     async with pool.acquire() as conn:
         result = await conn.fetchrow(
-            """
-            SELECT * FROM activity.sp_demote_participant($1, $2, $3)
-            """,
+            SP_DEMOTE_PARTICIPANT,
             activity_id,
-            UUID(current_user["user_id"]),
+            current_user["user_id"],
             body.user_id
         )
 
@@ -75,6 +74,6 @@ async def demote_participant(
             activity_id=activity_id,
             user_id=body.user_id,
             role="member",
-            demoted_at=datetime.now(),
+            demoted_at=result["demoted_at"],
             message="User demoted to member successfully"
         )
@@ -1,13 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from uuid import UUID
+import asyncpg
 
 from app.auth import get_current_user
 from app.database import get_pool
 from app.models.responses import WaitlistResponse, WaitlistEntry
 from app.utils.rate_limit import limiter
+from app.utils.responses import trusted_response
 
 router = APIRouter(prefix="/api/v1/participation", tags=["waitlist"])
 
+# waitlist_position is aliased to the model's field name
+SP_GET_WAITLIST = (
+    "SELECT waitlist_id, user_id, username, first_name, profile_photo_url, "
+    "waitlist_position AS position, created_at, notified_at, total_count "
+    "FROM activity.sp_get_waitlist($1, $2, $3, $4)"
+)
+
 
 @router.get("/activities/{activity_id}/waitlist", response_model=WaitlistResponse)
 @limiter.limit("60/minute")
@@ -17,7 +26,7 @@ async def get_waitlist(
     limit: int = 50,
     offset: int = 0,
     current_user: dict = Depends(get_current_user),
-    pool = Depends(get_pool)
+    pool: asyncpg.Pool = Depends(get_pool)
 ):
     """
     View waitlist (organizer/co-organizer only).
@@ -26,11 +35,9 @@ async def get_waitlist(
     """
     async with pool.acquire() as conn:
         rows = await conn.fetch(
-            """
-            SELECT * FROM activity.sp_get_waitlist($1, $2, $3, $4)
-            """,
+            SP_GET_WAITLIST,
             activity_id,
-            UUID(current_user["user_id"]),
+            current_user["user_id"],
             limit,
             offset
         )
@@ -45,21 +52,12 @@ async def get_waitlist(
         total_count = rows[0]["total_count"] if rows else 0
 
         waitlist = [
-            WaitlistEntry(
-                waitlist_id=row["waitlist_id"],
-                user_id=row["user_id"],
-                username=row["username"],
-                first_name=row["first_name"],
-                profile_photo_url=row["profile_photo_url"],
-                position=row["position"],
-                created_at=row["created_at"],
-                notified_at=row["notified_at"]
-            )
+            WaitlistEntry.model_construct(**dict(row))
             for row in rows
         ]
 
-        return WaitlistResponse(
+        return trusted_response(WaitlistResponse.model_construct(
             activity_id=activity_id,
             total_count=total_count,
             waitlist=waitlist
-        )
+        ), exclude_none=True)
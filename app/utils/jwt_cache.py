@@ -0,0 +1,99 @@
+import time
+from typing import Any, Dict, Hashable, Optional
+
+
+class _Node:
+    __slots__ = ("key", "value", "exp", "visited", "prev", "next")
+
+    def __init__(self, key: Hashable, value: Any, exp: float):
+        self.key = key
+        self.value = value
+        self.exp = exp
+        self.visited = False
+        self.prev: Optional["_Node"] = None
+        self.next: Optional["_Node"] = None
+
+
+class SieveCache:
+    """
+    Fixed-size cache using the SIEVE eviction policy.
+
+    New entries are inserted at the head of a doubly-linked list. On eviction a
+    "hand" walks from the tail towards the head, clearing the visited bit of
+    entries that were hit since the last pass and evicting the first entry that
+    was not. Hot entries stay resident while one-shot entries are dropped
+    cheaply; both lookup and eviction are O(1) amortized.
+
+    Every entry carries an absolute expiry timestamp and is never returned
+    after it has passed.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, _Node] = {}
+        self._head: Optional[_Node] = None
+        self._tail: Optional[_Node] = None
+        self._hand: Optional[_Node] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        node = self._entries.get(key)
+        if node is None:
+            return None
+        if node.exp <= time.time():
+            self._remove(node)
+            return None
+        node.visited = True
+        return node.value
+
+    def insert(self, key: Hashable, value: Any, exp: float) -> None:
+        """Cache value under key until the absolute timestamp exp"""
+        node = self._entries.get(key)
+        if node is not None:
+            node.value = value
+            node.exp = exp
+            node.visited = True
+            return
+
+        if len(self._entries) >= self.maxsize:
+            self._evict()
+
+        node = _Node(key, value, exp)
+        node.next = self._head
+        if self._head is not None:
+            self._head.prev = node
+        self._head = node
+        if self._tail is None:
+            self._tail = node
+        self._entries[key] = node
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._head = self._tail = self._hand = None
+
+    def _evict(self) -> None:
+        node = self._hand or self._tail
+        while node is not None and node.visited:
+            node.visited = False
+            node = node.prev or self._tail
+        if node is None:
+            return
+        self._hand = node.prev
+        self._remove(node)
+
+    def _remove(self, node: _Node) -> None:
+        if self._hand is node:
+            self._hand = node.prev
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+        node.prev = node.next = None
+        del self._entries[node.key]
@@ -1,17 +1,71 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from fastapi import Request, HTTPException
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from uuid import UUID
 
-limiter = Limiter(key_func=get_remote_address)
+from app.config import settings
+
+# Counters live in Redis so limits hold across workers and pods; the moving
+# window is checked and updated atomically in one Lua round trip. The storage
+# calls are synchronous, so short socket timeouts keep a hung Redis from
+# stalling the event loop, and an unreachable one degrades to per-process
+# in-memory limits instead of failing every limited request.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI or f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+    storage_options={
+        "socket_timeout": settings.RATE_LIMIT_REDIS_TIMEOUT,
+        "socket_connect_timeout": settings.RATE_LIMIT_REDIS_TIMEOUT
+    },
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
+    swallow_errors=True
+)
+
+
+def get_user_key(request: Request) -> str:
+    """
+    Rate limit key for authenticated routes: the caller's user_id.
+
+    SlowAPI checks limits after FastAPI has resolved the route's dependencies,
+    so get_current_user has already stored the user on request.state. Falls
+    back to the client address if the route has no authenticated user.
+
+    Use with limiter.shared_limit and a fixed scope so the budget covers the
+    route as a whole; a plain limit() is scoped to the concrete request path,
+    i.e. one budget per activity or invitation id.
+    """
+    user = getattr(request.state, "user", None)
+    if user is None:
+        return get_remote_address(request)
+    return f"user:{user['user_id']}"
+
+
+def get_user_activity_key(request: Request) -> str:
+    """
+    Rate limit key for one caller acting on one activity.
+
+    The activity id is normalized so every spelling FastAPI accepts for the
+    same UUID (braces, urn:uuid:, no hyphens, upper case) shares one budget.
+    """
+    try:
+        activity_id = UUID(request.path_params["activity_id"])
+    except (KeyError, ValueError):
+        return get_user_key(request)
+    return f"{get_user_key(request)}:activity:{activity_id}"
 
 
 async def _rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
     """Custom rate limit handler"""
-    raise HTTPException(
+    # The window length bounds how long the caller has to wait in a moving window
+    retry_after = exc.limit.limit.get_expiry()
+    return ORJSONResponse(
         status_code=429,
-        detail={
+        content={
             "error": "Rate limit exceeded",
-            "retry_after": exc.retry_after
-        }
+            "retry_after": retry_after
+        },
+        headers={"Retry-After": str(retry_after)}
     )
@@ -0,0 +1,20 @@
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def trusted_response(model: BaseModel, exclude_none: bool = False) -> Response:
+    """
+    Serialize a response model built from trusted stored procedure rows.
+
+    Returning a Response skips FastAPI's response_model validation, which
+    would otherwise re-validate every row; the route's response_model still
+    documents the schema. Pair with Model.model_construct() on the way in.
+    pydantic-core writes the JSON in one pass (asyncpg's UUID type included).
+
+    Route options such as response_model_exclude_none don't apply to the returned
+    Response, so callers pass exclude_none here instead.
+    """
+    return Response(
+        content=model.model_dump_json(exclude_none=exclude_none),
+        media_type="application/json"
+    )
@@ -4,11 +4,16 @@
 -- Complete implementation of all stored procedures for the Participation API
 -- Schema: activity
 -- All procedures include comprehensive RAISE NOTICE logging for debugging
+-- Write procedures return the NOW() of their transaction (e.g. joined_at) so
+-- API responses carry the timestamp that was actually stored. Their return
+-- types changed, so each is dropped before being recreated.
 -- =====================================================
 
 -- =====================================================
 -- 1. sp_join_activity
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_join_activity(UUID, UUID, activity.subscription_level);
+
 CREATE OR REPLACE FUNCTION activity.sp_join_activity(
     p_activity_id UUID,
     p_user_id UUID,
@@ -19,7 +24,8 @@ RETURNS TABLE (
     participation_status activity.participation_status,
     waitlist_position INT,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    joined_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -45,7 +51,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -56,7 +62,7 @@ BEGIN
     IF v_activity.status != 'published' THEN
         RAISE NOTICE 'Activity not published: status=%', v_activity.status;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'ACTIVITY_NOT_PUBLISHED'::VARCHAR(50), 'Activity is not published'::TEXT;
+            'ACTIVITY_NOT_PUBLISHED'::VARCHAR(50), 'Activity is not published'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -64,7 +70,7 @@ BEGIN
     IF v_activity.scheduled_at <= NOW() THEN
         RAISE NOTICE 'Activity is in the past: scheduled_at=%', v_activity.scheduled_at;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Cannot join past activities'::TEXT;
+            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Cannot join past activities'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -76,7 +82,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'User not found: %', p_user_id;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'USER_NOT_FOUND'::VARCHAR(50), 'User does not exist'::TEXT;
+            'USER_NOT_FOUND'::VARCHAR(50), 'User does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -87,7 +93,7 @@ BEGIN
     IF NOT v_user.is_active THEN
         RAISE NOTICE 'User is not active: user_id=%', p_user_id;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'USER_NOT_FOUND'::VARCHAR(50), 'User does not exist'::TEXT;
+            'USER_NOT_FOUND'::VARCHAR(50), 'User does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -95,7 +101,7 @@ BEGIN
     IF v_user.status = 'banned' THEN
         RAISE NOTICE 'User is banned: user_id=%', p_user_id;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'USER_BANNED'::VARCHAR(50), 'Account is banned'::TEXT;
+            'USER_BANNED'::VARCHAR(50), 'Account is banned'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -103,7 +109,7 @@ BEGIN
     IF v_activity.organizer_user_id = p_user_id THEN
         RAISE NOTICE 'User is organizer of activity: user_id=%', p_user_id;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'USER_IS_ORGANIZER'::VARCHAR(50), 'Organizer cannot join own activity'::TEXT;
+            'USER_IS_ORGANIZER'::VARCHAR(50), 'Organizer cannot join own activity'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -116,7 +122,7 @@ BEGIN
     IF v_already_joined THEN
         RAISE NOTICE 'User already joined: user_id=%', p_user_id;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'ALREADY_JOINED'::VARCHAR(50), 'Already joined this activity'::TEXT;
+            'ALREADY_JOINED'::VARCHAR(50), 'Already joined this activity'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -128,7 +134,7 @@ BEGIN
     IF v_already_joined THEN
         RAISE NOTICE 'User already on waitlist: user_id=%', p_user_id;
         RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-            'ALREADY_JOINED'::VARCHAR(50), 'Already on waitlist for this activity'::TEXT;
+            'ALREADY_JOINED'::VARCHAR(50), 'Already on waitlist for this activity'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -144,7 +150,7 @@ BEGIN
         IF v_block_exists THEN
             RAISE NOTICE 'User is blocked: user_id=%, organizer_id=%', p_user_id, v_activity.organizer_user_id;
             RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-                'BLOCKED_USER'::VARCHAR(50), 'Cannot join this activity due to blocking'::TEXT;
+                'BLOCKED_USER'::VARCHAR(50), 'Cannot join this activity due to blocking'::TEXT, NULL::TIMESTAMPTZ;
             RETURN;
         END IF;
     ELSE
@@ -164,7 +170,7 @@ BEGIN
         IF NOT v_friendship_exists THEN
             RAISE NOTICE 'Not friends with organizer for friends_only activity';
             RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-                'FRIENDS_ONLY'::VARCHAR(50), 'Activity is friends only'::TEXT;
+                'FRIENDS_ONLY'::VARCHAR(50), 'Activity is friends only'::TEXT, NULL::TIMESTAMPTZ;
             RETURN;
         END IF;
     END IF;
@@ -183,7 +189,7 @@ BEGIN
         IF NOT v_invitation_exists THEN
             RAISE NOTICE 'No valid invitation for invite_only activity';
             RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-                'INVITE_ONLY'::VARCHAR(50), 'Activity is invite only'::TEXT;
+                'INVITE_ONLY'::VARCHAR(50), 'Activity is invite only'::TEXT, NULL::TIMESTAMPTZ;
             RETURN;
         END IF;
     END IF;
@@ -194,7 +200,7 @@ BEGIN
             RAISE NOTICE 'Premium only period active: joinable_at_free=%, now=%',
                 v_activity.joinable_at_free, NOW();
             RETURN QUERY SELECT FALSE, NULL::activity.participation_status, NULL::INT,
-                'PREMIUM_ONLY_PERIOD'::VARCHAR(50), 'Activity is currently only open to Premium members'::TEXT;
+                'PREMIUM_ONLY_PERIOD'::VARCHAR(50), 'Activity is currently only open to Premium members'::TEXT, NULL::TIMESTAMPTZ;
             RETURN;
         END IF;
     END IF;
@@ -221,7 +227,7 @@ BEGIN
         RAISE NOTICE 'Added to waitlist: position=%', v_next_position;
 
         RETURN QUERY SELECT TRUE, 'waitlisted'::activity.participation_status, v_next_position,
-            NULL::VARCHAR(50), NULL::TEXT;
+            NULL::VARCHAR(50), NULL::TEXT, NOW();
         RETURN;
     ELSE
         -- Add as participant
@@ -245,7 +251,7 @@ BEGIN
         RAISE NOTICE 'Successfully joined activity';
 
         RETURN QUERY SELECT TRUE, 'registered'::activity.participation_status, NULL::INT,
-            NULL::VARCHAR(50), NULL::TEXT;
+            NULL::VARCHAR(50), NULL::TEXT, NOW();
         RETURN;
     END IF;
 END;
@@ -254,6 +260,8 @@ $$;
 -- =====================================================
 -- 2. sp_leave_activity
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_leave_activity(UUID, UUID);
+
 CREATE OR REPLACE FUNCTION activity.sp_leave_activity(
     p_activity_id UUID,
     p_user_id UUID
@@ -264,7 +272,8 @@ RETURNS TABLE (
     was_waitlisted BOOLEAN,
     promoted_user_id UUID,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    left_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -285,7 +294,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
         RETURN QUERY SELECT FALSE, FALSE, FALSE, NULL::UUID,
-            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -295,7 +304,7 @@ BEGIN
     IF v_activity.organizer_user_id = p_user_id THEN
         RAISE NOTICE 'User is organizer - cannot leave';
         RETURN QUERY SELECT FALSE, FALSE, FALSE, NULL::UUID,
-            'IS_ORGANIZER'::VARCHAR(50), 'Organizer cannot leave activity'::TEXT;
+            'IS_ORGANIZER'::VARCHAR(50), 'Organizer cannot leave activity'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -303,7 +312,7 @@ BEGIN
     IF v_activity.scheduled_at <= NOW() THEN
         RAISE NOTICE 'Activity is in the past: scheduled_at=%', v_activity.scheduled_at;
         RETURN QUERY SELECT FALSE, FALSE, FALSE, NULL::UUID,
-            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Cannot leave past activities'::TEXT;
+            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Cannot leave past activities'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -356,12 +365,12 @@ BEGIN
             RAISE NOTICE 'Waitlist promotion complete';
 
             RETURN QUERY SELECT TRUE, TRUE, FALSE, v_next_waitlist.user_id,
-                NULL::VARCHAR(50), NULL::TEXT;
+                NULL::VARCHAR(50), NULL::TEXT, NOW();
             RETURN;
         ELSE
             RAISE NOTICE 'No waitlist to promote';
             RETURN QUERY SELECT TRUE, TRUE, FALSE, NULL::UUID,
-                NULL::VARCHAR(50), NULL::TEXT;
+                NULL::VARCHAR(50), NULL::TEXT, NOW();
             RETURN;
         END IF;
     END IF;
@@ -391,14 +400,14 @@ BEGIN
         RAISE NOTICE 'Removed from waitlist and updated positions';
 
         RETURN QUERY SELECT TRUE, FALSE, TRUE, NULL::UUID,
-            NULL::VARCHAR(50), NULL::TEXT;
+            NULL::VARCHAR(50), NULL::TEXT, NOW();
         RETURN;
     END IF;
 
     -- Not a participant or on waitlist
     RAISE NOTICE 'User is not a participant or on waitlist';
     RETURN QUERY SELECT FALSE, FALSE, FALSE, NULL::UUID,
-        'NOT_PARTICIPANT'::VARCHAR(50), 'Not a participant of this activity'::TEXT;
+        'NOT_PARTICIPANT'::VARCHAR(50), 'Not a participant of this activity'::TEXT, NULL::TIMESTAMPTZ;
     RETURN;
 END;
 $$;
@@ -406,6 +415,8 @@ $$;
 -- =====================================================
 -- 3. sp_cancel_participation
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_cancel_participation(UUID, UUID, TEXT);
+
 CREATE OR REPLACE FUNCTION activity.sp_cancel_participation(
     p_activity_id UUID,
     p_user_id UUID,
@@ -415,7 +426,8 @@ RETURNS TABLE (
     success BOOLEAN,
     promoted_user_id UUID,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    left_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -435,7 +447,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -443,7 +455,7 @@ BEGIN
     IF v_activity.scheduled_at <= NOW() THEN
         RAISE NOTICE 'Activity is in the past: scheduled_at=%', v_activity.scheduled_at;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Cannot cancel past activities'::TEXT;
+            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Cannot cancel past activities'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -455,21 +467,21 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'User is not a participant';
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'NOT_PARTICIPANT'::VARCHAR(50), 'Not a participant of this activity'::TEXT;
+            'NOT_PARTICIPANT'::VARCHAR(50), 'Not a participant of this activity'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
     IF v_participant.participation_status = 'cancelled' THEN
         RAISE NOTICE 'Participation already cancelled';
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'ALREADY_CANCELLED'::VARCHAR(50), 'Participation already cancelled'::TEXT;
+            'ALREADY_CANCELLED'::VARCHAR(50), 'Participation already cancelled'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
     IF v_participant.participation_status != 'registered' THEN
         RAISE NOTICE 'Participation status is not registered: status=%', v_participant.participation_status;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'NOT_PARTICIPANT'::VARCHAR(50), 'Not a registered participant'::TEXT;
+            'NOT_PARTICIPANT'::VARCHAR(50), 'Not a registered participant'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -524,12 +536,12 @@ BEGIN
         RAISE NOTICE 'Waitlist promotion complete';
 
         RETURN QUERY SELECT TRUE, v_next_waitlist.user_id,
-            NULL::VARCHAR(50), NULL::TEXT;
+            NULL::VARCHAR(50), NULL::TEXT, NOW();
         RETURN;
     ELSE
         RAISE NOTICE 'No waitlist to promote';
         RETURN QUERY SELECT TRUE, NULL::UUID,
-            NULL::VARCHAR(50), NULL::TEXT;
+            NULL::VARCHAR(50), NULL::TEXT, NOW();
         RETURN;
     END IF;
 END;
@@ -715,6 +727,8 @@ $$;
 -- =====================================================
 -- 6. sp_promote_participant
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_promote_participant(UUID, UUID, UUID);
+
 CREATE OR REPLACE FUNCTION activity.sp_promote_participant(
     p_activity_id UUID,
     p_organizer_user_id UUID,
@@ -723,7 +737,8 @@ CREATE OR REPLACE FUNCTION activity.sp_promote_participant(
 RETURNS TABLE (
     success BOOLEAN,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    promoted_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -742,7 +757,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
         RETURN QUERY SELECT FALSE,
-            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -751,7 +766,7 @@ BEGIN
         RAISE NOTICE 'User is not organizer: user_id=%, actual_organizer=%',
             p_organizer_user_id, v_activity.organizer_user_id;
         RETURN QUERY SELECT FALSE,
-            'NOT_ORGANIZER'::VARCHAR(50), 'Only organizer can promote participants'::TEXT;
+            'NOT_ORGANIZER'::VARCHAR(50), 'Only organizer can promote participants'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -763,7 +778,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Target user is not a participant';
         RETURN QUERY SELECT FALSE,
-            'TARGET_NOT_MEMBER'::VARCHAR(50), 'User is not a member participant'::TEXT;
+            'TARGET_NOT_MEMBER'::VARCHAR(50), 'User is not a member participant'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -772,20 +787,20 @@ BEGIN
         IF v_participant.role = 'co_organizer' THEN
             RAISE NOTICE 'Target user is already co-organizer';
             RETURN QUERY SELECT FALSE,
-                'ALREADY_CO_ORGANIZER'::VARCHAR(50), 'User is already a co-organizer'::TEXT;
+                'ALREADY_CO_ORGANIZER'::VARCHAR(50), 'User is already a co-organizer'::TEXT, NULL::TIMESTAMPTZ;
             RETURN;
         END IF;
 
         RAISE NOTICE 'Target user is not a member: role=%', v_participant.role;
         RETURN QUERY SELECT FALSE,
-            'TARGET_NOT_MEMBER'::VARCHAR(50), 'User is not a member participant'::TEXT;
+            'TARGET_NOT_MEMBER'::VARCHAR(50), 'User is not a member participant'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
     IF v_participant.participation_status != 'registered' THEN
         RAISE NOTICE 'Target user is not registered: status=%', v_participant.participation_status;
         RETURN QUERY SELECT FALSE,
-            'TARGET_NOT_MEMBER'::VARCHAR(50), 'User is not a registered participant'::TEXT;
+            'TARGET_NOT_MEMBER'::VARCHAR(50), 'User is not a registered participant'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -798,7 +813,7 @@ BEGIN
     RAISE NOTICE 'User promoted successfully';
 
     RETURN QUERY SELECT TRUE,
-        NULL::VARCHAR(50), NULL::TEXT;
+        NULL::VARCHAR(50), NULL::TEXT, NOW();
     RETURN;
 END;
 $$;
@@ -806,6 +821,8 @@ $$;
 -- =====================================================
 -- 7. sp_demote_participant
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_demote_participant(UUID, UUID, UUID);
+
 CREATE OR REPLACE FUNCTION activity.sp_demote_participant(
     p_activity_id UUID,
     p_organizer_user_id UUID,
@@ -814,7 +831,8 @@ CREATE OR REPLACE FUNCTION activity.sp_demote_participant(
 RETURNS TABLE (
     success BOOLEAN,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    demoted_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -833,7 +851,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
         RETURN QUERY SELECT FALSE,
-            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -842,7 +860,7 @@ BEGIN
         RAISE NOTICE 'User is not organizer: user_id=%, actual_organizer=%',
             p_organizer_user_id, v_activity.organizer_user_id;
         RETURN QUERY SELECT FALSE,
-            'NOT_ORGANIZER'::VARCHAR(50), 'Only organizer can demote participants'::TEXT;
+            'NOT_ORGANIZER'::VARCHAR(50), 'Only organizer can demote participants'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -854,7 +872,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Target user is not a participant';
         RETURN QUERY SELECT FALSE,
-            'NOT_CO_ORGANIZER'::VARCHAR(50), 'User is not a co-organizer'::TEXT;
+            'NOT_CO_ORGANIZER'::VARCHAR(50), 'User is not a co-organizer'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -862,7 +880,7 @@ BEGIN
     IF v_participant.role != 'co_organizer' THEN
         RAISE NOTICE 'Target user is not co-organizer: role=%', v_participant.role;
         RETURN QUERY SELECT FALSE,
-            'NOT_CO_ORGANIZER'::VARCHAR(50), 'User is not a co-organizer'::TEXT;
+            'NOT_CO_ORGANIZER'::VARCHAR(50), 'User is not a co-organizer'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -875,7 +893,7 @@ BEGIN
     RAISE NOTICE 'User demoted successfully';
 
     RETURN QUERY SELECT TRUE,
-        NULL::VARCHAR(50), NULL::TEXT;
+        NULL::VARCHAR(50), NULL::TEXT, NOW();
     RETURN;
 END;
 $$;
@@ -883,6 +901,8 @@ $$;
 -- =====================================================
 -- 8. sp_mark_attendance
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_mark_attendance(UUID, UUID, JSONB);
+
 CREATE OR REPLACE FUNCTION activity.sp_mark_attendance(
     p_activity_id UUID,
     p_marking_user_id UUID,
@@ -893,7 +913,8 @@ RETURNS TABLE (
     updated_count INT,
     failed_updates JSONB,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    updated_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -916,7 +937,7 @@ BEGIN
     IF v_attendance_count > 100 THEN
         RAISE NOTICE 'Too many attendance updates: count=%', v_attendance_count;
         RETURN QUERY SELECT FALSE, 0, NULL::JSONB,
-            'TOO_MANY_UPDATES'::VARCHAR(50), 'Maximum 100 attendances per request'::TEXT;
+            'TOO_MANY_UPDATES'::VARCHAR(50), 'Maximum 100 attendances per request'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -928,7 +949,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
         RETURN QUERY SELECT FALSE, 0, NULL::JSONB,
-            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -936,7 +957,7 @@ BEGIN
     IF v_activity.scheduled_at > NOW() THEN
         RAISE NOTICE 'Activity has not completed: scheduled_at=%', v_activity.scheduled_at;
         RETURN QUERY SELECT FALSE, 0, NULL::JSONB,
-            'ACTIVITY_NOT_COMPLETED'::VARCHAR(50), 'Activity has not yet completed'::TEXT;
+            'ACTIVITY_NOT_COMPLETED'::VARCHAR(50), 'Activity has not yet completed'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -949,7 +970,7 @@ BEGIN
         RAISE NOTICE 'User is not authorized to mark attendance: role=%',
             COALESCE(v_marking_participant.role::TEXT, 'none');
         RETURN QUERY SELECT FALSE, 0, NULL::JSONB,
-            'NOT_AUTHORIZED'::VARCHAR(50), 'Only organizer or co-organizer can mark attendance'::TEXT;
+            'NOT_AUTHORIZED'::VARCHAR(50), 'Only organizer or co-organizer can mark attendance'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -999,7 +1020,7 @@ BEGIN
         v_update_count, jsonb_array_length(v_failed_array);
 
     RETURN QUERY SELECT TRUE, v_update_count, v_failed_array,
-        NULL::VARCHAR(50), NULL::TEXT;
+        NULL::VARCHAR(50), NULL::TEXT, NOW();
     RETURN;
 END;
 $$;
@@ -1007,6 +1028,8 @@ $$;
 -- =====================================================
 -- 9. sp_confirm_attendance
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_confirm_attendance(UUID, UUID, UUID);
+
 CREATE OR REPLACE FUNCTION activity.sp_confirm_attendance(
     p_activity_id UUID,
     p_confirmed_user_id UUID,
@@ -1017,7 +1040,8 @@ RETURNS TABLE (
     confirmation_id UUID,
     new_verification_count INT,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    created_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -1036,7 +1060,7 @@ BEGIN
     IF p_confirmed_user_id = p_confirmer_user_id THEN
         RAISE NOTICE 'Cannot confirm own attendance';
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::INT,
-            'SELF_CONFIRMATION'::VARCHAR(50), 'Cannot confirm your own attendance'::TEXT;
+            'SELF_CONFIRMATION'::VARCHAR(50), 'Cannot confirm your own attendance'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1048,7 +1072,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::INT,
-            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1056,7 +1080,7 @@ BEGIN
     IF v_activity.scheduled_at > NOW() THEN
         RAISE NOTICE 'Activity has not completed: scheduled_at=%', v_activity.scheduled_at;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::INT,
-            'ACTIVITY_NOT_COMPLETED'::VARCHAR(50), 'Activity has not yet completed'::TEXT;
+            'ACTIVITY_NOT_COMPLETED'::VARCHAR(50), 'Activity has not yet completed'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1069,7 +1093,7 @@ BEGIN
         RAISE NOTICE 'Confirmer did not attend: status=%',
             COALESCE(v_confirmer_participant.attendance_status::TEXT, 'none');
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::INT,
-            'CONFIRMER_NOT_ATTENDED'::VARCHAR(50), 'You must have attended status to confirm others'::TEXT;
+            'CONFIRMER_NOT_ATTENDED'::VARCHAR(50), 'You must have attended status to confirm others'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1082,7 +1106,7 @@ BEGIN
         RAISE NOTICE 'Confirmed user did not attend: status=%',
             COALESCE(v_confirmed_participant.attendance_status::TEXT, 'none');
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::INT,
-            'CONFIRMED_NOT_ATTENDED'::VARCHAR(50), 'User does not have attended status'::TEXT;
+            'CONFIRMED_NOT_ATTENDED'::VARCHAR(50), 'User does not have attended status'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1097,7 +1121,7 @@ BEGIN
     IF v_already_confirmed THEN
         RAISE NOTICE 'Already confirmed this user';
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::INT,
-            'ALREADY_CONFIRMED'::VARCHAR(50), 'You already confirmed this user for this activity'::TEXT;
+            'ALREADY_CONFIRMED'::VARCHAR(50), 'You already confirmed this user for this activity'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1117,7 +1141,7 @@ BEGIN
         v_new_confirmation_id, v_verification_count;
 
     RETURN QUERY SELECT TRUE, v_new_confirmation_id, v_verification_count,
-        NULL::VARCHAR(50), NULL::TEXT;
+        NULL::VARCHAR(50), NULL::TEXT, NOW();
     RETURN;
 END;
 $$;
@@ -1211,6 +1235,25 @@ $$;
 -- =====================================================
 -- 11. sp_send_invitations
 -- =====================================================
+-- Results are returned as typed composite arrays so clients receive UUIDs and
+-- timestamps directly. Changing the return type requires dropping the function.
+DROP FUNCTION IF EXISTS activity.sp_send_invitations(UUID, UUID, UUID[], TEXT, INT);
+DROP TYPE IF EXISTS activity.sent_invitation;
+DROP TYPE IF EXISTS activity.failed_invitation;
+
+CREATE TYPE activity.sent_invitation AS (
+    invitation_id UUID,
+    user_id UUID,
+    status activity.invitation_status,
+    invited_at TIMESTAMP WITH TIME ZONE,
+    expires_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TYPE activity.failed_invitation AS (
+    user_id UUID,
+    reason TEXT
+);
+
 CREATE OR REPLACE FUNCTION activity.sp_send_invitations(
     p_activity_id UUID,
     p_inviting_user_id UUID,
@@ -1222,8 +1265,8 @@ RETURNS TABLE (
     success BOOLEAN,
     invited_count INT,
     failed_count INT,
-    invitations JSONB,
-    failed_invitations JSONB,
+    invitations activity.sent_invitation[],
+    failed_invitations activity.failed_invitation[],
     error_code VARCHAR(50),
     error_message TEXT
 )
@@ -1239,8 +1282,8 @@ DECLARE
     v_is_blocked BOOLEAN;
     v_invite_count INT := 0;
     v_fail_count INT := 0;
-    v_invitations_array JSONB := '[]'::jsonb;
-    v_failed_array JSONB := '[]'::jsonb;
+    v_invitations_array activity.sent_invitation[] := '{}';
+    v_failed_array activity.failed_invitation[] := '{}';
     v_new_invitation_id UUID;
     v_expires_at TIMESTAMP WITH TIME ZONE;
 BEGIN
@@ -1250,7 +1293,7 @@ BEGIN
     -- Check max invitations
     IF array_length(p_user_ids, 1) > 50 THEN
         RAISE NOTICE 'Too many invitations: count=%', array_length(p_user_ids, 1);
-        RETURN QUERY SELECT FALSE, 0, 0, NULL::JSONB, NULL::JSONB,
+        RETURN QUERY SELECT FALSE, 0, 0, NULL::activity.sent_invitation[], NULL::activity.failed_invitation[],
             'TOO_MANY_INVITATIONS'::VARCHAR(50), 'Maximum 50 invitations per request'::TEXT;
         RETURN;
     END IF;
@@ -1262,7 +1305,7 @@ BEGIN
 
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', p_activity_id;
-        RETURN QUERY SELECT FALSE, 0, 0, NULL::JSONB, NULL::JSONB,
+        RETURN QUERY SELECT FALSE, 0, 0, NULL::activity.sent_invitation[], NULL::activity.failed_invitation[],
             'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
         RETURN;
     END IF;
@@ -1270,7 +1313,7 @@ BEGIN
     -- Check activity is published
     IF v_activity.status != 'published' THEN
         RAISE NOTICE 'Activity not published: status=%', v_activity.status;
-        RETURN QUERY SELECT FALSE, 0, 0, NULL::JSONB, NULL::JSONB,
+        RETURN QUERY SELECT FALSE, 0, 0, NULL::activity.sent_invitation[], NULL::activity.failed_invitation[],
             'ACTIVITY_NOT_FOUND'::VARCHAR(50), 'Activity is not published'::TEXT;
         RETURN;
     END IF;
@@ -1278,7 +1321,7 @@ BEGIN
     -- Check activity is invite_only
     IF v_activity.activity_privacy_level != 'invite_only' THEN
         RAISE NOTICE 'Activity is not invite_only: activity_privacy_level=%', v_activity.activity_privacy_level;
-        RETURN QUERY SELECT FALSE, 0, 0, NULL::JSONB, NULL::JSONB,
+        RETURN QUERY SELECT FALSE, 0, 0, NULL::activity.sent_invitation[], NULL::activity.failed_invitation[],
             'NOT_INVITE_ONLY'::VARCHAR(50), 'Activity is not invite-only'::TEXT;
         RETURN;
     END IF;
@@ -1291,7 +1334,7 @@ BEGIN
     IF NOT FOUND OR (v_inviting_participant.role != 'organizer' AND v_inviting_participant.role != 'co_organizer') THEN
         RAISE NOTICE 'User is not authorized to send invitations: role=%',
             COALESCE(v_inviting_participant.role::TEXT, 'none');
-        RETURN QUERY SELECT FALSE, 0, 0, NULL::JSONB, NULL::JSONB,
+        RETURN QUERY SELECT FALSE, 0, 0, NULL::activity.sent_invitation[], NULL::activity.failed_invitation[],
             'NOT_AUTHORIZED'::VARCHAR(50), 'Only organizer or co-organizer can send invitations'::TEXT;
         RETURN;
     END IF;
@@ -1308,10 +1351,7 @@ BEGIN
         -- Check user exists
         SELECT EXISTS(SELECT 1 FROM activity.users WHERE user_id = v_user_id) INTO v_user_exists;
         IF NOT v_user_exists THEN
-            v_failed_array := v_failed_array || jsonb_build_object(
-                'user_id', v_user_id,
-                'reason', 'User does not exist'
-            );
+            v_failed_array := v_failed_array || ROW(v_user_id, 'User does not exist')::activity.failed_invitation;
             v_fail_count := v_fail_count + 1;
             RAISE NOTICE 'User does not exist: %', v_user_id;
             CONTINUE;
@@ -1326,10 +1366,7 @@ BEGIN
         ) INTO v_already_invited;
 
         IF v_already_invited THEN
-            v_failed_array := v_failed_array || jsonb_build_object(
-                'user_id', v_user_id,
-                'reason', 'Already invited'
-            );
+            v_failed_array := v_failed_array || ROW(v_user_id, 'Already invited')::activity.failed_invitation;
             v_fail_count := v_fail_count + 1;
             RAISE NOTICE 'User already invited: %', v_user_id;
             CONTINUE;
@@ -1342,10 +1379,7 @@ BEGIN
         ) INTO v_already_participant;
 
         IF v_already_participant THEN
-            v_failed_array := v_failed_array || jsonb_build_object(
-                'user_id', v_user_id,
-                'reason', 'Already a participant'
-            );
+            v_failed_array := v_failed_array || ROW(v_user_id, 'Already a participant')::activity.failed_invitation;
             v_fail_count := v_fail_count + 1;
             RAISE NOTICE 'User already participant: %', v_user_id;
             CONTINUE;
@@ -1359,10 +1393,7 @@ BEGIN
         ) INTO v_is_blocked;
 
         IF v_is_blocked THEN
-            v_failed_array := v_failed_array || jsonb_build_object(
-                'user_id', v_user_id,
-                'reason', 'User is blocked'
-            );
+            v_failed_array := v_failed_array || ROW(v_user_id, 'User is blocked')::activity.failed_invitation;
             v_fail_count := v_fail_count + 1;
             RAISE NOTICE 'User is blocked: %', v_user_id;
             CONTINUE;
@@ -1377,13 +1408,9 @@ BEGIN
         )
         RETURNING invitation_id INTO v_new_invitation_id;
 
-        v_invitations_array := v_invitations_array || jsonb_build_object(
-            'invitation_id', v_new_invitation_id,
-            'user_id', v_user_id,
-            'status', 'pending',
-            'invited_at', NOW(),
-            'expires_at', v_expires_at
-        );
+        v_invitations_array := v_invitations_array || ROW(
+            v_new_invitation_id, v_user_id, 'pending'::activity.invitation_status, NOW(), v_expires_at
+        )::activity.sent_invitation;
         v_invite_count := v_invite_count + 1;
         RAISE NOTICE 'Invitation created: invitation_id=%', v_new_invitation_id;
     END LOOP;
@@ -1400,6 +1427,8 @@ $$;
 -- =====================================================
 -- 12. sp_accept_invitation
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_accept_invitation(UUID, UUID);
+
 CREATE OR REPLACE FUNCTION activity.sp_accept_invitation(
     p_invitation_id UUID,
     p_user_id UUID
@@ -1410,7 +1439,8 @@ RETURNS TABLE (
     participation_status activity.participation_status,
     waitlist_position INT,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    responded_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -1430,7 +1460,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Invitation not found: %', p_invitation_id;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::activity.participation_status, NULL::INT,
-            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Invitation does not exist'::TEXT;
+            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Invitation does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1442,7 +1472,7 @@ BEGIN
         RAISE NOTICE 'Invitation is for different user: expected=%, actual=%',
             v_invitation.user_id, p_user_id;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::activity.participation_status, NULL::INT,
-            'NOT_YOUR_INVITATION'::VARCHAR(50), 'This invitation is not for you'::TEXT;
+            'NOT_YOUR_INVITATION'::VARCHAR(50), 'This invitation is not for you'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1450,7 +1480,7 @@ BEGIN
     IF v_invitation.status != 'pending' THEN
         RAISE NOTICE 'Invitation already responded: status=%', v_invitation.status;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::activity.participation_status, NULL::INT,
-            'ALREADY_RESPONDED'::VARCHAR(50), 'Invitation already responded to'::TEXT;
+            'ALREADY_RESPONDED'::VARCHAR(50), 'Invitation already responded to'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1458,7 +1488,7 @@ BEGIN
     IF v_invitation.expires_at IS NOT NULL AND v_invitation.expires_at <= NOW() THEN
         RAISE NOTICE 'Invitation expired: expires_at=%', v_invitation.expires_at;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::activity.participation_status, NULL::INT,
-            'INVITATION_EXPIRED'::VARCHAR(50), 'Invitation has expired'::TEXT;
+            'INVITATION_EXPIRED'::VARCHAR(50), 'Invitation has expired'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1470,7 +1500,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Activity not found: %', v_invitation.activity_id;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::activity.participation_status, NULL::INT,
-            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT;
+            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Activity does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1478,7 +1508,7 @@ BEGIN
     IF v_activity.scheduled_at <= NOW() THEN
         RAISE NOTICE 'Activity is in the past: scheduled_at=%', v_activity.scheduled_at;
         RETURN QUERY SELECT FALSE, NULL::UUID, NULL::activity.participation_status, NULL::INT,
-            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Activity has already occurred'::TEXT;
+            'ACTIVITY_IN_PAST'::VARCHAR(50), 'Activity has already occurred'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1511,7 +1541,7 @@ BEGIN
 
         RETURN QUERY SELECT TRUE, v_invitation.activity_id,
             'waitlisted'::activity.participation_status, v_next_position,
-            NULL::VARCHAR(50), NULL::TEXT;
+            NULL::VARCHAR(50), NULL::TEXT, NOW();
         RETURN;
     ELSE
         -- Add as participant
@@ -1528,7 +1558,7 @@ BEGIN
 
         RETURN QUERY SELECT TRUE, v_invitation.activity_id,
             'registered'::activity.participation_status, NULL::INT,
-            NULL::VARCHAR(50), NULL::TEXT;
+            NULL::VARCHAR(50), NULL::TEXT, NOW();
         RETURN;
     END IF;
 END;
@@ -1537,6 +1567,8 @@ $$;
 -- =====================================================
 -- 13. sp_decline_invitation
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_decline_invitation(UUID, UUID);
+
 CREATE OR REPLACE FUNCTION activity.sp_decline_invitation(
     p_invitation_id UUID,
     p_user_id UUID
@@ -1545,7 +1577,8 @@ RETURNS TABLE (
     success BOOLEAN,
     activity_id UUID,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    responded_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -1562,7 +1595,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Invitation not found: %', p_invitation_id;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Invitation does not exist'::TEXT;
+            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Invitation does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1574,7 +1607,7 @@ BEGIN
         RAISE NOTICE 'Invitation is for different user: expected=%, actual=%',
             v_invitation.user_id, p_user_id;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'NOT_YOUR_INVITATION'::VARCHAR(50), 'This invitation is not for you'::TEXT;
+            'NOT_YOUR_INVITATION'::VARCHAR(50), 'This invitation is not for you'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1582,7 +1615,7 @@ BEGIN
     IF v_invitation.status != 'pending' THEN
         RAISE NOTICE 'Invitation already responded: status=%', v_invitation.status;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'ALREADY_RESPONDED'::VARCHAR(50), 'Invitation already responded to'::TEXT;
+            'ALREADY_RESPONDED'::VARCHAR(50), 'Invitation already responded to'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1595,7 +1628,7 @@ BEGIN
     RAISE NOTICE 'Invitation declined successfully';
 
     RETURN QUERY SELECT TRUE, v_invitation.activity_id,
-        NULL::VARCHAR(50), NULL::TEXT;
+        NULL::VARCHAR(50), NULL::TEXT, NOW();
     RETURN;
 END;
 $$;
@@ -1603,6 +1636,8 @@ $$;
 -- =====================================================
 -- 14. sp_cancel_invitation
 -- =====================================================
+DROP FUNCTION IF EXISTS activity.sp_cancel_invitation(UUID, UUID);
+
 CREATE OR REPLACE FUNCTION activity.sp_cancel_invitation(
     p_invitation_id UUID,
     p_cancelling_user_id UUID
@@ -1611,7 +1646,8 @@ RETURNS TABLE (
     success BOOLEAN,
     activity_id UUID,
     error_code VARCHAR(50),
-    error_message TEXT
+    error_message TEXT,
+    cancelled_at TIMESTAMPTZ
 )
 LANGUAGE plpgsql
 AS $$
@@ -1632,7 +1668,7 @@ BEGIN
     IF NOT FOUND THEN
         RAISE NOTICE 'Invitation not found: %', p_invitation_id;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Invitation does not exist'::TEXT;
+            'INVITATION_NOT_FOUND'::VARCHAR(50), 'Invitation does not exist'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1643,7 +1679,7 @@ BEGIN
     IF v_invitation.status != 'pending' THEN
         RAISE NOTICE 'Invitation already responded: status=%', v_invitation.status;
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'ALREADY_RESPONDED'::VARCHAR(50), 'Cannot cancel responded invitation'::TEXT;
+            'ALREADY_RESPONDED'::VARCHAR(50), 'Cannot cancel responded invitation'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1668,7 +1704,7 @@ BEGIN
     IF NOT v_is_authorized THEN
         RAISE NOTICE 'User not authorized to cancel invitation';
         RETURN QUERY SELECT FALSE, NULL::UUID,
-            'NOT_AUTHORIZED'::VARCHAR(50), 'Not authorized to cancel this invitation'::TEXT;
+            'NOT_AUTHORIZED'::VARCHAR(50), 'Not authorized to cancel this invitation'::TEXT, NULL::TIMESTAMPTZ;
         RETURN;
     END IF;
 
@@ -1680,7 +1716,7 @@ BEGIN
     RAISE NOTICE 'Invitation cancelled successfully';
 
     RETURN QUERY SELECT TRUE, v_invitation.activity_id,
-        NULL::VARCHAR(50), NULL::TEXT;
+        NULL::VARCHAR(50), NULL::TEXT, NOW();
     RETURN;
 END;
 $$;
@@ -1747,6 +1783,9 @@ $$;
 -- =====================================================
 -- 16. sp_get_sent_invitations
 -- =====================================================
+-- Adding the message column changes the return type, so drop first
+DROP FUNCTION IF EXISTS activity.sp_get_sent_invitations(UUID, UUID, activity.invitation_status, INT, INT);
+
 CREATE OR REPLACE FUNCTION activity.sp_get_sent_invitations(
     p_inviting_user_id UUID,
     p_activity_id UUID DEFAULT NULL,
@@ -1761,6 +1800,7 @@ RETURNS TABLE (
     user_id UUID,
     username VARCHAR(100),
     status activity.invitation_status,
+    message TEXT,
     invited_at TIMESTAMP WITH TIME ZONE,
     expires_at TIMESTAMP WITH TIME ZONE,
     responded_at TIMESTAMP WITH TIME ZONE,
@@ -1784,6 +1824,7 @@ BEGIN
             THEN 'expired'::activity.invitation_status
             ELSE i.status
         END AS status,
+        i.message,
         i.invited_at,
         i.expires_at,
         i.responded_at,
@@ -0,0 +1,16 @@
+import os
+
+# app.config requires these at import; tests never reach a real database or Redis,
+# and rate limits are counted in process memory
+for _name, _value in {
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "activitydb",
+    "DB_USER": "postgres",
+    "DB_PASSWORD": "postgres",
+    "JWT_SECRET_KEY": "dev-secret-key-change-in-production",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "RATE_LIMIT_STORAGE_URI": "memory://",
+}.items():
+    os.environ.setdefault(_name, _value)
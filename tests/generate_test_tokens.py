@@ -4,123 +4,222 @@ generate_test_tokens.py
 Generates JWT tokens for test users with specified claims
 """
 
+import base64
+import hashlib
+import hmac
+import os
+import struct
 import sys
-from datetime import datetime, timedelta
-from jose import jwt
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # the script also runs without the API's requirements installed
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # JWT configuration (must match API configuration)
 JWT_SECRET = "dev-secret-key-change-in-production"
 JWT_ALGORITHM = "HS256"
 
-# Test user configurations
+# HS256 signing state shared by every token: the key schedule (ipad/opad blocks)
+# is derived once here and copied per token, and the header never changes
+_BASE_HMAC = hmac.new(JWT_SECRET.encode(), digestmod=hashlib.sha256)
+
+
+def _b64(data):
+    """base64url without padding, as used by JWT"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+_HEADER_B64 = _b64(b'{"alg":"HS256","typ":"JWT"}')
+
+# Every token in a run shares the same expiry (NumericDate, one day out)
+EXP = int(time.time()) + 86400
+
+# exp is always the last claim, so its JSON (and the closing brace) is a constant
+_EXP_SUFFIX = b',"exp":%d}' % EXP
+
+# Tokens are reused across invocations within the same 15-minute bucket
+CACHE_DIR = Path(tempfile.gettempdir())
+CACHE_BUCKET_SECONDS = 900
+
+# Test user configurations; optional claims (e.g. "org_id") go under "extra"
 TEST_USERS = {
     "organizer": {
         "user_id": "00000001-0000-0000-0000-000000000001",
         "email": "organizer@test.com",
         "subscription_level": "premium",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "premium": {
         "user_id": "00000001-0000-0000-0000-000000000002",
         "email": "premium@test.com",
         "subscription_level": "premium",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "free1": {
         "user_id": "00000001-0000-0000-0000-000000000003",
         "email": "free1@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "free2": {
         "user_id": "00000001-0000-0000-0000-000000000004",
         "email": "free2@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "free3": {
         "user_id": "00000001-0000-0000-0000-000000000005",
         "email": "free3@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "free4": {
         "user_id": "00000001-0000-0000-0000-000000000006",
         "email": "free4@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "free5": {
         "user_id": "00000001-0000-0000-0000-000000000007",
         "email": "free5@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "blocked": {
         "user_id": "00000001-0000-0000-0000-000000000008",
         "email": "blocked@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "invitee1": {
         "user_id": "00000001-0000-0000-0000-000000000009",
         "email": "invitee1@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     },
     "invitee2": {
         "user_id": "00000001-0000-0000-0000-000000000010",
         "email": "invitee2@test.com",
         "subscription_level": "free",
-        "ghost_mode": False,
-        "org_id": None
+        "ghost_mode": False
     }
 }
 
 
-def generate_token(user_config):
-    """Generate JWT token for user"""
+def _claims_prefix(user_config):
+    """Claims JSON for a user, minus the shared exp claim and closing brace"""
     payload = {
         "sub": user_config["user_id"],
         "email": user_config["email"],
         "subscription_level": user_config["subscription_level"],
         "ghost_mode": user_config["ghost_mode"],
-        "exp": datetime.utcnow() + timedelta(days=1)
+        # Optional claims such as org_id, only for users that have them
+        **user_config.get("extra", {})
     }
 
-    if user_config["org_id"]:
-        payload["org_id"] = user_config["org_id"]
+    return _dumps(payload)[:-1]
+
+
+# Per-user claims are fixed, so their JSON is built once at import
+_PAYLOAD_PREFIX = {key: _claims_prefix(config) for key, config in TEST_USERS.items()}
+
+# Environment variable names for the 'all' output, e.g. b"TOKEN_FREE1"
+_TOKEN_VAR_NAMES = tuple(f"TOKEN_{key.upper()}".encode() for key in TEST_USERS)
+
+
+def generate_token(user_key):
+    """Generate JWT token for user"""
+    signing_input = _HEADER_B64 + b"." + _b64(_PAYLOAD_PREFIX[user_key] + _EXP_SUFFIX)
+    h = _BASE_HMAC.copy()
+    h.update(signing_input)
+    return (signing_input + b"." + _b64(h.digest())).decode()
+
+
+def _cache_fingerprint(user_key):
+    """Short hash of everything that shapes the token besides exp"""
+    h = hashlib.sha256()
+    for part in (JWT_SECRET.encode(), JWT_ALGORITHM.encode(), _PAYLOAD_PREFIX[user_key]):
+        h.update(part + b"\0")
+    return h.hexdigest()[:16]
+
+
+def cached_token(user_key):
+    """
+    Return the token for user_key, reusing one generated in the current bucket.
+
+    The filename carries a fingerprint of the secret, algorithm and claims, so
+    edits to any of them never serve an old token. The cache is best effort:
+    unreadable or unwritable files (e.g. owned by another user in a shared
+    /tmp) just mean signing a fresh token.
+    """
+    bucket = int(time.time() // CACHE_BUCKET_SECONDS)
+    cache_path = CACHE_DIR / f"jwt_{user_key}_{_cache_fingerprint(user_key)}_{bucket}.tok"
+    try:
+        return cache_path.read_text()
+    except OSError:
+        pass
+
+    token = generate_token(user_key)
+
+    # Write atomically so concurrent test runs never read a partial token
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}")
+    try:
+        tmp_path.write_text(token)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return token
+
+    # Drop this user's tokens from earlier buckets or older configurations
+    for stale_path in CACHE_DIR.glob(f"jwt_{user_key}_*.tok"):
+        if stale_path != cache_path:
+            try:
+                stale_path.unlink(missing_ok=True)
+            except OSError:
+                pass
 
-    token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return token
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python3 generate_test_tokens.py <user_key>", file=sys.stderr)
+        print("Usage: python3 generate_test_tokens.py <user_key|all|--raw>", file=sys.stderr)
         print(f"Available users: {', '.join(TEST_USERS.keys())}", file=sys.stderr)
         sys.exit(1)
 
     user_key = sys.argv[1]
 
     if user_key == "all":
-        # Generate tokens for all users and export as environment variables
-        for key, config in TEST_USERS.items():
-            token = generate_token(config)
-            var_name = f"TOKEN_{key.upper()}"
-            print(f'export {var_name}="{token}"')
+        # Generate tokens for all users and export as environment variables,
+        # written to stdout in a single call
+        out = bytearray()
+        for var_name, key in zip(_TOKEN_VAR_NAMES, TEST_USERS):
+            out += b'export ' + var_name + b'="'
+            out += cached_token(key).encode() + b'"\n'
+        sys.stdout.buffer.write(out)
+    elif user_key == "--raw":
+        # All tokens in TEST_USERS order, each prefixed with its length as a
+        # big-endian uint16, for harnesses that read stdout directly
+        out = bytearray()
+        for key in TEST_USERS:
+            token = cached_token(key).encode()
+            out += struct.pack("!H", len(token)) + token
+        sys.stdout.buffer.write(out)
     elif user_key in TEST_USERS:
         # Generate token for specific user
-        token = generate_token(TEST_USERS[user_key])
+        token = cached_token(user_key)
         print(token)
     else:
         print(f"Error: Unknown user '{user_key}'", file=sys.stderr)
@@ -0,0 +1,32 @@
+import asyncio
+import time
+import uuid
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.auth import get_current_user
+from app.config import settings
+
+
+def _request(claims):
+    token = jwt.encode(
+        {"sub": str(uuid.uuid4()), "email": "user@example.com", "exp": int(time.time()) + 3600, **claims},
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM
+    )
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    return Request({"type": "http", "headers": headers})
+
+
+def test_token_without_audience_is_accepted():
+    user = asyncio.run(get_current_user(_request({})))
+    assert user["subscription_level"] == "free"
+
+
+def test_token_for_another_audience_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_current_user(_request({"aud": "billing-api"})))
+    assert exc_info.value.status_code == 401
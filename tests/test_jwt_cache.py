@@ -0,0 +1,43 @@
+import time
+
+from app.utils.jwt_cache import SieveCache
+
+
+def _exp():
+    return time.time() + 3600
+
+
+def test_visited_entry_survives_eviction():
+    cache = SieveCache(maxsize=3)
+    for key in ("a", "b", "c"):
+        cache.insert(key, key, _exp())
+
+    # "a" is the oldest entry but was hit, so the hand skips it and evicts "b"
+    assert cache.get("a") == "a"
+    cache.insert("d", "d", _exp())
+
+    assert cache.get("a") == "a"
+    assert cache.get("b") is None
+    assert cache.get("c") == "c"
+    assert cache.get("d") == "d"
+
+
+def test_len_never_exceeds_maxsize():
+    cache = SieveCache(maxsize=5)
+    for i in range(50):
+        cache.insert(i, i, _exp())
+        if i % 3 == 0:
+            cache.get(i)
+        assert len(cache) <= 5
+    assert len(cache) == 5
+
+
+def test_expired_entry_is_not_returned():
+    cache = SieveCache(maxsize=3)
+    cache.insert("stale", "value", time.time() - 1)
+    cache.insert("fresh", "value", _exp())
+
+    assert cache.get("stale") is None
+    assert cache.get("fresh") == "value"
+    # Expired entries are dropped on lookup
+    assert len(cache) == 1
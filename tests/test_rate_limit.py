@@ -0,0 +1,101 @@
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.database import get_pool
+from app.main import app
+from app.utils.rate_limit import limiter
+
+
+class _Conn:
+    async def fetchrow(self, query, *args):
+        # One successful row carrying the columns of both invitation procedures
+        return {
+            "success": True,
+            "activity_id": uuid4(),
+            "participation_status": "registered",
+            "responded_at": datetime.now(timezone.utc),
+            "invited_count": 0,
+            "failed_count": 0,
+            "invitations": [],
+            "failed_invitations": [],
+            "error_code": None,
+            "error_message": None,
+        }
+
+
+class _Acquire:
+    async def __aenter__(self):
+        return _Conn()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Pool:
+    def acquire(self):
+        return _Acquire()
+
+
+@pytest.fixture
+def client():
+    """App client with fresh rate limit counters and a stub pool"""
+    limiter.reset()
+    app.dependency_overrides[get_pool] = lambda: _Pool()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    limiter.reset()
+
+
+def _auth_header():
+    token = jwt.encode(
+        {"sub": str(uuid4()), "email": "organizer@test.com", "exp": int(time.time()) + 3600},
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_send_invitations_budget_is_shared_across_uuid_spellings(client):
+    activity_id = uuid4()
+    headers = _auth_header()
+    body = {"user_ids": [str(uuid4())]}
+    spellings = [
+        str(activity_id),
+        activity_id.hex,
+        str(activity_id).upper(),
+        f"{{{activity_id}}}",
+        activity_id.urn,
+    ]
+
+    # Use up the 10/minute budget with the canonical spelling
+    for _ in range(10):
+        response = client.post(f"/api/v1/participation/activities/{spellings[0]}/invitations", json=body, headers=headers)
+        assert response.status_code == 200
+
+    for spelling in spellings:
+        response = client.post(f"/api/v1/participation/activities/{spelling}/invitations", json=body, headers=headers)
+        assert response.status_code == 429, spelling
+
+
+def test_accept_invitation_budget_is_per_user(client):
+    headers = _auth_header()
+
+    # Every invitation id draws from the same per-user budget
+    for _ in range(10):
+        response = client.post(f"/api/v1/participation/invitations/{uuid4()}/accept", headers=headers)
+        assert response.status_code == 200
+
+    response = client.post(f"/api/v1/participation/invitations/{uuid4()}/accept", headers=headers)
+    assert response.status_code == 429
+    assert response.json() == {"error": "Rate limit exceeded", "retry_after": 60}
+    assert response.headers["Retry-After"] == "60"
+
+    # Another user from the same address still has a full budget
+    response = client.post(f"/api/v1/participation/invitations/{uuid4()}/accept", headers=_auth_header())
+    assert response.status_code == 200